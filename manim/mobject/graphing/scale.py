@@ -13,6 +13,10 @@ if TYPE_CHECKING:
     from manim.mobject.mobject import Mobject
 
 
+def _identity(value: float) -> float:
+    return value
+
+
 class _ScaleBase:
     """Scale baseclass for graphing/functions.
 
@@ -93,6 +97,22 @@ class LinearBase(_ScaleBase):
         super().__init__()
         self.scale_factor = scale_factor
 
+    @property
+    def scale_factor(self) -> float:
+        """The slope of the linear function."""
+        return self._scale_factor
+
+    @scale_factor.setter
+    def scale_factor(self, scale_factor: float) -> None:
+        self._scale_factor = scale_factor
+        # The default scale leaves values untouched, skip the
+        # multiplication and division for every transformed value.
+        if scale_factor == 1.0:
+            self.function = self.inverse_function = _identity
+        else:
+            vars(self).pop("function", None)
+            vars(self).pop("inverse_function", None)
+
     def function(self, value: float) -> float:
         """Multiplies the value by the scale factor.
 
@@ -139,16 +159,20 @@ class LogBase(_ScaleBase):
 
     def function(self, value: float) -> float:
         """Scales the value to fit it to a logarithmic scale.``self.function(5)==10**5``"""
+        if isinstance(value, np.ndarray):
+            if self.base == 2:
+                return np.exp2(value)
+            return np.power(float(self.base), value)
         return self.base**value
 
     def inverse_function(self, value: float) -> float:
         """Inverse of ``function``. The value must be greater than 0"""
         if isinstance(value, np.ndarray):
             condition = value.any() <= 0
-            func = lambda value, base: np.log(value) / np.log(base)
+            func = self._array_log
         else:
             condition = value <= 0
-            func = math.log
+            func = self._scalar_log
 
         if condition:
             raise ValueError(
@@ -157,6 +181,26 @@ class LogBase(_ScaleBase):
         value = func(value, self.base)
         return value
 
+    @staticmethod
+    def _scalar_log(value: float, base: float) -> float:
+        """Takes the logarithm of a number, using the dedicated math
+        functions for the common bases."""
+        if base == 10:
+            return math.log10(value)
+        if base == 2:
+            return math.log2(value)
+        return math.log(value, base)
+
+    @staticmethod
+    def _array_log(value: np.ndarray, base: float) -> np.ndarray:
+        """Takes the logarithm of an array, using the dedicated numpy
+        functions for the common bases."""
+        if base == 10:
+            return np.log10(value)
+        if base == 2:
+            return np.log2(value)
+        return np.log(value) / np.log(base)
+
     def get_custom_labels(
         self,
         val_range: Iterable[float],
@@ -175,13 +219,21 @@ class LogBase(_ScaleBase):
             Additional arguments to be passed to :class:`~.Integer`.
         """
 
+        values = np.asarray(val_range, dtype=float)
+        if np.any(values <= 0):
+            raise ValueError(
+                "log(0) is undefined. Make sure the value is in the domain of the function"
+            )
+        # compute all the exponents at once instead of one call per label.
+        exponents = self._array_log(values, self.base)
+
         # uses `format` syntax to control the number of decimal places.
         tex_labels = [
             Integer(
                 self.base,
-                unit="^{%s}" % (f"{self.inverse_function(i):.{unit_decimal_places}f}"),
+                unit="^{%s}" % (f"{exponent:.{unit_decimal_places}f}"),
                 **base_config,
             )
-            for i in val_range
+            for exponent in exponents
         ]
         return tex_labels
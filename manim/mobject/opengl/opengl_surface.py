@@ -59,6 +59,11 @@ class OpenGLSurface(OpenGLMobject):
         ("color", np.float32, (4,)),
     ]
     shader_folder = "surface"
+    # Maximum number of uv values passed to uv_func at once
+    uv_chunk_size = 65536
+    # Triangle indices only depend on the resolution, so they are computed
+    # once per resolution and shared (read-only) between surfaces.
+    _triangle_indices_cache: dict[tuple[int, int], np.ndarray] = {}
 
     def __init__(
         self,
@@ -101,6 +106,9 @@ class OpenGLSurface(OpenGLMobject):
         self.epsilon = epsilon
 
         self.triangle_indices = None
+        self._shader_data = None
+        self._shader_data_owner = None
+        self._shader_data_columns = {}
         super().__init__(
             color=color,
             opacity=opacity,
@@ -120,57 +128,121 @@ class OpenGLSurface(OpenGLMobject):
         return (u, v, 0.0)
 
     def init_points(self):
-        dim = self.dim
         nu, nv = self.resolution
         u_range = np.linspace(*self.u_range, nu)
         v_range = np.linspace(*self.v_range, nv)
-
-        # Get three lists:
-        # - Points generated by pure uv values
-        # - Those generated by values nudged by du
-        # - Those generated by values nudged by dv
-        point_lists = []
-        for du, dv in [(0, 0), (self.epsilon, 0), (0, self.epsilon)]:
-            uv_grid = np.array([[[u + du, v + dv] for v in v_range] for u in u_range])
-            point_grid = np.apply_along_axis(lambda p: self.uv_func(*p), 2, uv_grid)
-            point_lists.append(point_grid.reshape((nu * nv, dim)))
+        u_grid, v_grid = np.meshgrid(u_range, v_range, indexing="ij")
+        u_values, v_values = u_grid.ravel(), v_grid.ravel()
+
+        # Evaluate, in a single call, three blocks of uv values:
+        # - The pure uv values
+        # - Those values nudged by du
+        # - Those values nudged by dv
+        all_u_values = np.concatenate(
+            [u_values, u_values + self.epsilon, u_values],
+        )
+        all_v_values = np.concatenate(
+            [v_values, v_values, v_values + self.epsilon],
+        )
         # Rather than tracking normal vectors, the points list will hold on to the
         # infinitesimal nudged values alongside the original values.  This way, one
         # can perform all the manipulations they'd like to the surface, and normals
         # are still easily recoverable.
-        self.set_points(np.vstack(point_lists))
+        self.set_points(self._evaluate_uv_func(all_u_values, all_v_values))
+
+    def _evaluate_uv_func(self, u_values, v_values):
+        """Evaluates :meth:`uv_func` on flat arrays of ``u`` and ``v`` values.
+
+        ``uv_func`` is called on chunks of at most :attr:`uv_chunk_size`
+        values, which works for the usual numpy-based parametrizations and
+        keeps their temporary arrays small enough to stay in cache. If that
+        fails, or does not return one array of values per coordinate, it is
+        evaluated point by point instead.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape ``(len(u_values), dim)`` containing the points.
+        """
+        dim = self.dim
+        num_points = len(u_values)
+        points = np.empty((num_points, dim))
+        try:
+            for start in range(0, num_points, self.uv_chunk_size):
+                chunk = slice(start, start + self.uv_chunk_size)
+                u_chunk = u_values[chunk]
+                coords = np.broadcast_arrays(*self.uv_func(u_chunk, v_values[chunk]))
+                if len(coords) != dim or coords[0].shape != u_chunk.shape:
+                    break
+                np.stack(coords, axis=-1, out=points[chunk])
+            else:
+                return points
+        except Exception:
+            pass
+        return np.fromiter(
+            (self.uv_func(u, v) for u, v in zip(u_values, v_values)),
+            dtype=np.dtype((float, (dim,))),
+            count=num_points,
+        )
 
     def compute_triangle_indices(self):
         # TODO, if there is an event which changes
         # the resolution of the surface, make sure
         # this is called.
         nu, nv = self.resolution
+        cache = OpenGLSurface._triangle_indices_cache
+        if (nu, nv) not in cache:
+            indices = self._build_triangle_indices(nu, nv)
+            indices.flags.writeable = False
+            cache[(nu, nv)] = indices
+        self.triangle_indices = cache[(nu, nv)]
+
+    @staticmethod
+    def _build_triangle_indices(nu, nv):
         if nu == 0 or nv == 0:
-            self.triangle_indices = np.zeros(0, dtype=int)
-            return
-        index_grid = np.arange(nu * nv).reshape((nu, nv))
-        indices = np.zeros(6 * (nu - 1) * (nv - 1), dtype=int)
-        indices[0::6] = index_grid[:-1, :-1].flatten()  # Top left
-        indices[1::6] = index_grid[+1:, :-1].flatten()  # Bottom left
-        indices[2::6] = index_grid[:-1, +1:].flatten()  # Top right
-        indices[3::6] = index_grid[:-1, +1:].flatten()  # Top right
-        indices[4::6] = index_grid[+1:, :-1].flatten()  # Bottom left
-        indices[5::6] = index_grid[+1:, +1:].flatten()  # Bottom right
-        self.triangle_indices = indices
+            return np.zeros(0, dtype=np.int32)
+        index_grid = np.arange(nu * nv, dtype=np.int32).reshape((nu, nv))
+        top_left = index_grid[:-1, :-1]
+        indices = np.stack(
+            [
+                top_left,  # Top left
+                top_left + nv,  # Bottom left
+                top_left + 1,  # Top right
+                top_left + 1,  # Top right
+                top_left + nv,  # Bottom left
+                top_left + nv + 1,  # Bottom right
+            ],
+            axis=-1,
+        )
+        return indices.ravel()
 
     def get_triangle_indices(self):
         return self.triangle_indices
 
     def get_surface_points_and_nudged_points(self):
+        """Returns the surface points, followed by the points nudged
+        by ``du`` and those nudged by ``dv``.
+
+        The three blocks are stored one after the other in :attr:`points`,
+        and each of them is returned as a view of that array.
+        """
         points = self.points
         k = len(points) // 3
         return points[:k], points[k : 2 * k], points[2 * k :]
 
     def get_unit_normals(self):
         s_points, du_points, dv_points = self.get_surface_points_and_nudged_points()
-        normals = np.cross(
-            (du_points - s_points) / self.epsilon,
-            (dv_points - s_points) / self.epsilon,
+        # Dividing the nudge vectors by epsilon would not change the direction
+        # of their cross product, so it is skipped before normalizing.
+        du_vects = du_points - s_points
+        dv_vects = dv_points - s_points
+        normals = np.stack(
+            (
+                du_vects[:, 1] * dv_vects[:, 2] - du_vects[:, 2] * dv_vects[:, 1],
+                du_vects[:, 2] * dv_vects[:, 0] - du_vects[:, 0] * dv_vects[:, 2],
+                du_vects[:, 0] * dv_vects[:, 1] - du_vects[:, 1] * dv_vects[:, 0],
+            ),
+            axis=-1,
         )
         return normalize_along_axis(normals, 1)
 
@@ -183,18 +255,15 @@ class OpenGLSurface(OpenGLMobject):
             return self
 
         nu, nv = smobject.resolution
+        # The surface points and both blocks of nudged points are
+        # processed together, as one batch of three grids
         self.set_points(
-            np.vstack(
-                [
-                    self.get_partial_points_array(
-                        arr.copy(),
-                        a,
-                        b,
-                        (nu, nv, 3),
-                        axis=axis,
-                    )
-                    for arr in smobject.get_surface_points_and_nudged_points()
-                ],
+            self.get_partial_points_array(
+                smobject.points.copy(),
+                a,
+                b,
+                (nu, nv, 3),
+                axis=axis,
             ),
         )
         return self
@@ -202,47 +271,41 @@ class OpenGLSurface(OpenGLMobject):
     def get_partial_points_array(self, points, a, b, resolution, axis):
         if len(points) == 0:
             return points
-        nu, nv = resolution[:2]
-        points = points.reshape(resolution)
+        # points may hold several stacked grids sharing the same resolution
+        grids = points.reshape((-1, *resolution))
         max_index = resolution[axis] - 1
         lower_index, lower_residue = integer_interpolate(0, max_index, a)
         upper_index, upper_residue = integer_interpolate(0, max_index, b)
         if axis == 0:
-            points[:lower_index] = interpolate(
-                points[lower_index],
-                points[lower_index + 1],
+            grids[:, :lower_index] = interpolate(
+                grids[:, lower_index],
+                grids[:, lower_index + 1],
                 lower_residue,
-            )
-            points[upper_index + 1 :] = interpolate(
-                points[upper_index],
-                points[upper_index + 1],
+            )[:, np.newaxis]
+            grids[:, upper_index + 1 :] = interpolate(
+                grids[:, upper_index],
+                grids[:, upper_index + 1],
                 upper_residue,
-            )
+            )[:, np.newaxis]
         else:
-            shape = (nu, 1, resolution[2])
-            points[:, :lower_index] = interpolate(
-                points[:, lower_index],
-                points[:, lower_index + 1],
+            grids[:, :, :lower_index] = interpolate(
+                grids[:, :, lower_index],
+                grids[:, :, lower_index + 1],
                 lower_residue,
-            ).reshape(shape)
-            points[:, upper_index + 1 :] = interpolate(
-                points[:, upper_index],
-                points[:, upper_index + 1],
+            )[:, :, np.newaxis]
+            grids[:, :, upper_index + 1 :] = interpolate(
+                grids[:, :, upper_index],
+                grids[:, :, upper_index + 1],
                 upper_residue,
-            ).reshape(shape)
-        return points.reshape((nu * nv, *resolution[2:]))
+            )[:, :, np.newaxis]
+        return grids.reshape((-1, *resolution[2:]))
 
     def sort_faces_back_to_front(self, vect=OUT):
-        tri_is = self.triangle_indices
-        indices = list(range(len(tri_is) // 3))
-        points = self.points
-
-        def index_dot(index):
-            return np.dot(points[tri_is[3 * index]], vect)
-
-        indices.sort(key=index_dot)
-        for k in range(3):
-            tri_is[k::3] = tri_is[k::3][indices]
+        triangles = self.triangle_indices.reshape((-1, 3))
+        depths = np.dot(self.points[triangles[:, 0]], vect)
+        order = np.argsort(depths, kind="stable")
+        # The computed triangle indices are shared, so this creates a new array
+        self.triangle_indices = triangles[order].ravel()
         return self
 
     # For shaders
@@ -257,19 +320,51 @@ class OpenGLSurface(OpenGLMobject):
             color of each vertex)
         """
         s_points, du_points, dv_points = self.get_surface_points_and_nudged_points()
-        shader_data = np.zeros(len(s_points), dtype=self.shader_dtype)
+        shader_data = self.get_resized_shader_data_array(len(s_points))
+        columns = self._shader_data_columns
         if "points" not in self.locked_data_keys:
-            shader_data["point"] = s_points
-            shader_data["du_point"] = du_points
-            shader_data["dv_point"] = dv_points
+            columns["point"][:] = s_points
+            columns["du_point"][:] = du_points
+            columns["dv_point"][:] = dv_points
             if self.colorscale:
                 if not hasattr(self, "color_by_val"):
                     self.color_by_val = self._get_color_by_value(s_points)
-                shader_data["color"] = self.color_by_val
+                columns["color"][:] = self.color_by_val
             else:
                 self.fill_in_shader_color_info(shader_data)
         return shader_data
 
+    def get_resized_shader_data_array(self, length):
+        # Surfaces rebuild their shader data every frame, so the array from
+        # the previous call is overwritten whenever its length still matches.
+        # Copies of this surface allocate their own array.
+        if (
+            self._shader_data is None
+            or len(self._shader_data) != length
+            or self._shader_data_owner != id(self)
+        ):
+            self._shader_data = np.zeros(length, dtype=self.shader_dtype)
+            self._shader_data_owner = id(self)
+            # All the fields of the shader data are float32, so each of them
+            # is a range of columns of the array seen as a float32 matrix.
+            # Writing to these views skips the structured field lookups.
+            flat_data = self._shader_data.view(np.float32).reshape(
+                (length, self._shader_data.itemsize // 4),
+            )
+            self._shader_data_columns = {
+                name: flat_data[:, offset // 4 : (offset + dtype.itemsize) // 4]
+                for name, (dtype, offset) in self._shader_data.dtype.fields.items()
+            }
+        return self._shader_data
+
+    def read_data_to_shader(self, shader_data, shader_data_key, data_key):
+        if shader_data is not self._shader_data:
+            return super().read_data_to_shader(shader_data, shader_data_key, data_key)
+        if data_key in self.locked_data_keys:
+            return
+        self.check_data_alignment(shader_data, data_key)
+        self._shader_data_columns[shader_data_key][:] = self.data[data_key]
+
     def fill_in_shader_color_info(self, shader_data):
         """Fills in the shader color data when the surface
         is all one color.
@@ -343,7 +438,8 @@ class OpenGLSurface(OpenGLMobject):
         return return_colors
 
     def get_shader_vert_indices(self):
-        return self.get_triangle_indices()
+        # The renderer uploads vertex indices as 32-bit integers
+        return self.get_triangle_indices().astype(np.int32, copy=False)
 
 
 class OpenGLSurfaceGroup(OpenGLSurface):
@@ -420,26 +516,26 @@ class OpenGLTexturedSurface(OpenGLSurface):
 
     def init_data(self):
         super().init_data()
-        self.im_coords = np.zeros((0, 2))
-        self.opacity = np.zeros((0, 1))
+        # Stored in the float32 format of their shader fields
+        self.im_coords = np.zeros((0, 2), dtype=np.float32)
+        self.opacity = np.zeros((0, 1), dtype=np.float32)
 
     def init_points(self):
         nu, nv = self.uv_surface.resolution
         self.set_points(self.uv_surface.points)
-        self.im_coords = np.array(
-            [
-                [u, v]
-                for u in np.linspace(0, 1, nu)
-                for v in np.linspace(1, 0, nv)  # Reverse y-direction
-            ],
+        u_grid, v_grid = np.meshgrid(
+            np.linspace(0, 1, nu, dtype=np.float32),
+            np.linspace(1, 0, nv, dtype=np.float32),  # Reverse y-direction
+            indexing="ij",
         )
+        self.im_coords = np.stack([u_grid.ravel(), v_grid.ravel()], axis=-1)
 
     def init_colors(self):
-        self.opacity = np.array([self.uv_surface.rgbas[:, 3]])
+        self.opacity = np.array([self.uv_surface.rgbas[:, 3]], dtype=np.float32)
 
     def set_opacity(self, opacity, recurse=True):
         for mob in self.get_family(recurse):
-            mob.opacity = np.array([[o] for o in listify(opacity)])
+            mob.opacity = np.array([[o] for o in listify(opacity)], dtype=np.float32)
         return self
 
     def pointwise_become_partial(self, tsmobject, a, b, axis=1):
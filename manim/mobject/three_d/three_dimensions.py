@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from manim.typing import Point3D, Vector3D
-from manim.utils.color import BLUE, BLUE_D, BLUE_E, LIGHT_GREY, WHITE, interpolate_color
+from manim.utils.color import BLUE, BLUE_D, BLUE_E, LIGHT_GREY, WHITE
 
 __all__ = [
     "ThreeDVMobject",
@@ -19,6 +19,7 @@ __all__ = [
     "Torus",
 ]
 
+from functools import lru_cache
 from typing import Any, Callable, Iterable, Sequence
 
 import numpy as np
@@ -40,12 +41,32 @@ from manim.utils.color import (
     WHITE,
     ManimColor,
     ParsableManimColor,
-    interpolate_color,
 )
 from manim.utils.iterables import tuplify
 from manim.utils.space_ops import normalize, perpendicular_bisector, z_to_vector
 
 
+@lru_cache(maxsize=32)
+def _evenly_spaced_pivots(
+    pivot_min: float, pivot_max: float, num_colors: int
+) -> np.ndarray:
+    """Returns the pivots :meth:`Surface.set_fill_by_value` uses to spread
+    ``num_colors`` colors over ``[pivot_min, pivot_max]``.
+
+    The result is cached, as surfaces updated every frame keep asking for
+    the same pivots. It is read-only since it is shared between calls.
+    """
+    pivot_frequency = (pivot_max - pivot_min) / (num_colors - 1)
+    pivots = np.arange(
+        start=pivot_min,
+        stop=pivot_max + pivot_frequency,
+        step=pivot_frequency,
+        dtype=np.float64,
+    )
+    pivots.flags.writeable = False
+    return pivots
+
+
 class ThreeDVMobject(VMobject, metaclass=ConvertToOpenGL):
     def __init__(self, shade_in_3d: bool = True, **kwargs):
         super().__init__(shade_in_3d=shade_in_3d, **kwargs)
@@ -284,51 +305,74 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
             )
             return self
 
-        ranges = [axes.x_range, axes.y_range, axes.z_range]
-
-        if type(colorscale[0]) is tuple:
-            new_colors, pivots = [
-                [i for i, j in colorscale],
-                [j for i, j in colorscale],
-            ]
-        else:
-            new_colors = colorscale
-
-            pivot_min = ranges[axis][0]
-            pivot_max = ranges[axis][1]
-            pivot_frequency = (pivot_max - pivot_min) / (len(new_colors) - 1)
-            pivots = np.arange(
-                start=pivot_min,
-                stop=pivot_max + pivot_frequency,
-                step=pivot_frequency,
+        mobs = self.family_members_with_points()
+        if not mobs:
+            return self
+        new_colors, pivots = self._parse_fill_spec(colorscale, axes, axis)
+        midpoints = np.array([mob.get_midpoint() for mob in mobs])
+        axis_values = axes.point_to_coords(midpoints)[:, axis]
+
+        # Values strictly between the first and last pivots get a color
+        # interpolated between the first pivot greater than them and the
+        # previous one.
+        mob_rgbas = np.zeros((len(mobs), 4))
+        between = (axis_values > pivots[0]) & (axis_values < pivots[-1])
+        if np.any(between):
+            values = axis_values[between]
+            upper_indices = np.searchsorted(pivots, values, side="right")
+            lower_pivots = pivots[upper_indices - 1]
+            upper_pivots = pivots[upper_indices]
+            alphas = np.minimum(
+                (values - lower_pivots) / (upper_pivots - lower_pivots), 1
+            )
+            alphas = alphas[:, np.newaxis]
+            rgbas = np.array([color.to_rgba() for color in new_colors])
+            mob_rgbas[between] = (
+                rgbas[upper_indices - 1] * (1 - alphas) + rgbas[upper_indices] * alphas
             )
 
-        for mob in self.family_members_with_points():
-            axis_value = axes.point_to_coords(mob.get_midpoint())[axis]
+        # Faces whose axis value is NaN match none of the branches and
+        # keep their color.
+        for mob, axis_value, is_between, mob_rgba in zip(
+            mobs, axis_values, between, mob_rgbas
+        ):
             if axis_value <= pivots[0]:
                 mob.set_color(new_colors[0])
             elif axis_value >= pivots[-1]:
                 mob.set_color(new_colors[-1])
-            else:
-                for i, pivot in enumerate(pivots):
-                    if pivot > axis_value:
-                        color_index = (axis_value - pivots[i - 1]) / (
-                            pivots[i] - pivots[i - 1]
-                        )
-                        color_index = min(color_index, 1)
-                        mob_color = interpolate_color(
-                            new_colors[i - 1],
-                            new_colors[i],
-                            color_index,
-                        )
-                        if config.renderer == RendererType.OPENGL:
-                            mob.set_color(mob_color, recurse=False)
-                        elif config.renderer == RendererType.CAIRO:
-                            mob.set_color(mob_color, family=False)
-                        break
+            elif is_between:
+                mob_color = ManimColor(mob_rgba)
+                if config.renderer == RendererType.OPENGL:
+                    mob.set_color(mob_color, recurse=False)
+                elif config.renderer == RendererType.CAIRO:
+                    mob.set_color(mob_color, family=False)
 
         return self
 
+    @staticmethod
+    def _parse_fill_spec(
+        colorscale: list[ParsableManimColor] | list[tuple[ParsableManimColor, float]],
+        axes: Mobject,
+        axis: int,
+    ) -> tuple[list[ManimColor], np.ndarray]:
+        """Splits the colorscale passed to :meth:`set_fill_by_value` into
+        its colors and the ``float64`` array of pivots where they apply.
+
+        If no pivots are given, they are spread evenly over the range of
+        the chosen axis.
+        """
+        if isinstance(colorscale[0], tuple):
+            new_colors = [ManimColor(color) for color, _ in colorscale]
+            pivots = np.array([pivot for _, pivot in colorscale], dtype=np.float64)
+        else:
+            new_colors = [ManimColor(color) for color in colorscale]
+
+            ranges = [axes.x_range, axes.y_range, axes.z_range]
+            pivots = _evenly_spaced_pivots(
+                float(ranges[axis][0]), float(ranges[axis][1]), len(new_colors)
+            )
+        return new_colors, pivots
+
 
 # Specific shapes
 
@@ -324,7 +324,9 @@ class Mesh(Object3D):
         if self.indices is None:
             index_buffer_object = None
         else:
-            vert_index_data = self.indices.astype("i4").tobytes()
+            # Index buffers are uploaded as 32-bit integers, avoid converting
+            # indices which already have that type.
+            vert_index_data = self.indices.astype("i4", copy=False).tobytes()
             if vert_index_data:
                 index_buffer_object = self.shader.context.buffer(vert_index_data)
             else:
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from manim.mobject.graphing.scale import LinearBase, LogBase
+
+
+def test_linear_base_default_scale_is_identity():
+    scaling = LinearBase()
+    values = np.array([-2.0, 0.0, 3.5])
+
+    assert scaling.function(3.5) == 3.5
+    assert scaling.inverse_function(3.5) == 3.5
+    assert scaling.function(values) is values
+
+
+@pytest.mark.parametrize("scale_factor", [1.0, 2.0, 0.5])
+def test_linear_base_after_setting_scale_factor(scale_factor):
+    scaling = LinearBase(3.0)
+    scaling.scale_factor = scale_factor
+    values = np.array([-2.0, 0.0, 3.5])
+
+    assert scaling.scale_factor == scale_factor
+    np.testing.assert_allclose(scaling.function(values), scale_factor * values)
+    np.testing.assert_allclose(scaling.inverse_function(values), values / scale_factor)
+    np.testing.assert_allclose(
+        scaling.inverse_function(scaling.function(values)), values
+    )
+    assert scaling.inverse_function(scaling.function(1.5)) == 1.5
+
+
+def test_linear_base_leaves_identity_when_scale_factor_changes():
+    scaling = LinearBase()
+    scaling.scale_factor = 2.0
+
+    assert scaling.function(3.0) == 6.0
+    assert scaling.inverse_function(3.0) == 1.5
+
+    scaling.scale_factor = 1.0
+    assert scaling.function(3.0) == 3.0
+
+
+@pytest.mark.parametrize("base", [2, 10, np.e])
+def test_log_base_function_and_inverse(base):
+    scaling = LogBase(base)
+    exponents = np.array([-2.0, 0.0, 0.5, 3.0])
+
+    values = scaling.function(exponents)
+
+    np.testing.assert_allclose(values, base**exponents)
+    np.testing.assert_allclose(scaling.inverse_function(values), exponents)
+    for exponent, value in zip(exponents, values):
+        assert scaling.function(float(exponent)) == pytest.approx(value)
+        assert scaling.inverse_function(float(value)) == pytest.approx(exponent)
+
+
+@pytest.mark.parametrize("base", [2, 10])
+def test_log_base_inverse_of_exact_powers(base):
+    scaling = LogBase(base)
+    exponents = [-3, 0, 1, 3, 10]
+
+    for exponent in exponents:
+        assert scaling.inverse_function(base**exponent) == exponent
+    np.testing.assert_array_equal(
+        scaling.inverse_function(np.array([base**e for e in exponents], dtype=float)),
+        exponents,
+    )
+
+
+@pytest.mark.parametrize("base", [2, 10, np.e])
+def test_log_base_function_of_negative_integer_exponents(base):
+    exponents = np.array([-2, -1, 0, 3])
+
+    np.testing.assert_allclose(
+        LogBase(base).function(exponents),
+        [base**-2.0, base**-1.0, 1.0, base**3.0],
+    )
+
+
+def test_log_base_inverse_of_non_positive_value_raises():
+    with pytest.raises(ValueError, match="log\\(0\\) is undefined"):
+        LogBase().inverse_function(0)
+
+
+@pytest.mark.parametrize("base", [2, 10, np.e])
+def test_log_base_custom_labels_match_inverse_function(base):
+    scaling = LogBase(base)
+    val_range = [base**-1, 1, base**0.5, base**2, base**3]
+
+    labels = scaling.get_custom_labels(val_range, unit_decimal_places=2)
+
+    assert [label.unit for label in labels] == [
+        f"^{{{scaling.inverse_function(value):.2f}}}" for value in val_range
+    ]
+
+
+def test_log_base_custom_labels_reject_non_positive_values():
+    with pytest.raises(ValueError, match="log\\(0\\) is undefined"):
+        LogBase().get_custom_labels([0, 1, 10])
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import GREEN, RED, YELLOW, Surface, config
+from manim.constants import RendererType
+from manim.utils.color import interpolate_color
+
+
+class _IdentityAxes:
+    # Axes whose coordinates are the scene coordinates of the point
+    x_range = y_range = z_range = (-1, 1, 0.5)
+
+    def point_to_coords(self, point):
+        return np.asarray(point)
+
+
+def _scan_fill_by_value(surface, axes, colorscale, axis):
+    # Reference implementation, scanning the pivots for every face
+    new_colors = [color for color, _ in colorscale]
+    pivots = [pivot for _, pivot in colorscale]
+    for mob in surface.family_members_with_points():
+        axis_value = axes.point_to_coords(mob.get_midpoint())[axis]
+        if axis_value <= pivots[0]:
+            mob.set_color(new_colors[0])
+        elif axis_value >= pivots[-1]:
+            mob.set_color(new_colors[-1])
+        else:
+            for i, pivot in enumerate(pivots):
+                if pivot > axis_value:
+                    color_index = (axis_value - pivots[i - 1]) / (
+                        pivots[i] - pivots[i - 1]
+                    )
+                    color_index = min(color_index, 1)
+                    mob_color = interpolate_color(
+                        new_colors[i - 1],
+                        new_colors[i],
+                        color_index,
+                    )
+                    if config.renderer == RendererType.OPENGL:
+                        mob.set_color(mob_color, recurse=False)
+                    elif config.renderer == RendererType.CAIRO:
+                        mob.set_color(mob_color, family=False)
+                    break
+
+
+def test_set_fill_by_value_matches_pivot_scan(monkeypatch):
+    # Out of range, on a pivot, between pivots and a NaN midpoint
+    axis_values = [-1, -0.5, -0.2, 0, 0.3, 0.5, 2, np.nan]
+    colorscale = [(RED, -0.5), (YELLOW, 0), (GREEN, 0.5)]
+    surfaces = []
+    for _ in range(2):
+        surface = Surface(
+            lambda u, v: np.array([u, v, 0]),
+            resolution=(len(axis_values), 1),
+        )
+        for face, value in zip(surface, axis_values):
+            monkeypatch.setattr(
+                face, "get_midpoint", lambda value=value: np.array([0, 0, value])
+            )
+        surfaces.append(surface)
+    surface, expected = surfaces
+    nan_face_rgbas = surface[-1].get_fill_rgbas().copy()
+
+    surface.set_fill_by_value(axes=_IdentityAxes(), colorscale=colorscale, axis=2)
+    _scan_fill_by_value(expected, _IdentityAxes(), colorscale, axis=2)
+
+    for face, expected_face in zip(surface, expected):
+        np.testing.assert_allclose(
+            face.get_fill_rgbas(), expected_face.get_fill_rgbas()
+        )
+    np.testing.assert_array_equal(surface[-1].get_fill_rgbas(), nan_face_rgbas)
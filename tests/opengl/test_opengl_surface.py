@@ -1,7 +1,13 @@
+import math
+
 import numpy as np
+import pytest
 
+from manim.constants import RIGHT, UP
+from manim.mobject.opengl.opengl_image_mobject import OpenGLImageMobject
 from manim.mobject.opengl.opengl_surface import OpenGLSurface
 from manim.mobject.opengl.opengl_three_dimensions import OpenGLSurfaceMesh
+from manim.utils.bezier import integer_interpolate, interpolate
 
 
 def test_surface_initialization(using_opengl_renderer):
@@ -12,3 +18,191 @@ def test_surface_initialization(using_opengl_renderer):
     )
 
     mesh = OpenGLSurfaceMesh(surface)
+
+
+def test_surface_points_with_non_vectorized_uv_func(using_opengl_renderer):
+    vectorized = OpenGLSurface(
+        lambda u, v: (np.cos(u), v, 0.0),
+        resolution=(7, 5),
+    )
+    scalar_only = OpenGLSurface(
+        lambda u, v: np.array([math.cos(u), v, 0]),
+        resolution=(7, 5),
+    )
+
+    assert vectorized.points.shape == (3 * 7 * 5, 3)
+    np.testing.assert_allclose(vectorized.points, scalar_only.points)
+
+
+def test_sorting_faces_leaves_shared_triangle_indices_unchanged(
+    using_opengl_renderer,
+):
+    surface = OpenGLSurface(
+        lambda u, v: (u, v, u * v),
+        resolution=(6, 4),
+    )
+    other = OpenGLSurface(resolution=(6, 4))
+    cached_indices = OpenGLSurface._triangle_indices_cache[(6, 4)]
+    expected = cached_indices.copy()
+
+    surface.sort_faces_back_to_front(np.array([1.0, -2.0, 0.5]))
+
+    assert not np.array_equal(surface.get_triangle_indices(), expected)
+    np.testing.assert_array_equal(other.get_triangle_indices(), expected)
+    np.testing.assert_array_equal(cached_indices, expected)
+    assert OpenGLSurface._triangle_indices_cache[(6, 4)] is cached_indices
+
+
+def test_shader_data_is_reused_and_reflects_moved_points(using_opengl_renderer):
+    surface = OpenGLSurface(
+        lambda u, v: (u, v, u * v),
+        resolution=(5, 4),
+    )
+    shader_data = surface.get_shader_data()
+
+    surface.shift(RIGHT)
+
+    assert surface.get_shader_data() is shader_data
+    s_points, du_points, dv_points = surface.get_surface_points_and_nudged_points()
+    np.testing.assert_array_equal(shader_data["point"], s_points.astype(np.float32))
+    np.testing.assert_array_equal(shader_data["du_point"], du_points.astype(np.float32))
+    np.testing.assert_array_equal(shader_data["dv_point"], dv_points.astype(np.float32))
+
+
+@pytest.mark.parametrize("shallow", [False, True])
+def test_surface_copies_get_their_own_shader_data(using_opengl_renderer, shallow):
+    surface = OpenGLSurface(
+        lambda u, v: (u, v, u * v),
+        resolution=(5, 4),
+    )
+    shader_data = surface.get_shader_data()
+    expected = shader_data.tobytes()
+
+    surface_copy = surface.copy(shallow=shallow)
+    surface_copy.shift(UP)
+    copy_data = surface_copy.get_shader_data()
+
+    assert copy_data is not shader_data
+    assert shader_data.tobytes() == expected
+    np.testing.assert_array_equal(
+        copy_data["point"],
+        surface_copy.get_surface_points_and_nudged_points()[0].astype(np.float32),
+    )
+
+    expected_copy = copy_data.tobytes()
+    surface.shift(RIGHT)
+    assert surface.get_shader_data() is shader_data
+    assert copy_data.tobytes() == expected_copy
+
+
+def test_textured_surface_shader_data_matches_field_assignment(
+    using_opengl_renderer,
+):
+    rng = np.random.default_rng(0)
+    image = OpenGLImageMobject(rng.integers(0, 256, (4, 4, 4), dtype=np.uint8))
+    image.set_opacity(0.3)
+    shader_data = image.get_shader_data()
+
+    expected = np.zeros(len(shader_data), dtype=image.shader_dtype)
+    expected["im_coords"] = image.im_coords
+    expected["opacity"] = image.opacity
+
+    assert shader_data["im_coords"].tobytes() == expected["im_coords"].tobytes()
+    assert shader_data["opacity"].tobytes() == expected["opacity"].tobytes()
+
+
+def _partial_grid(points, a, b, resolution, axis):
+    # Reference implementation working on a single (nu, nv, dim) grid
+    nu, nv = resolution[:2]
+    points = points.copy().reshape(resolution)
+    max_index = resolution[axis] - 1
+    lower_index, lower_residue = integer_interpolate(0, max_index, a)
+    upper_index, upper_residue = integer_interpolate(0, max_index, b)
+    if axis == 0:
+        points[:lower_index] = interpolate(
+            points[lower_index],
+            points[lower_index + 1],
+            lower_residue,
+        )
+        points[upper_index + 1 :] = interpolate(
+            points[upper_index],
+            points[upper_index + 1],
+            upper_residue,
+        )
+    else:
+        shape = (nu, 1, resolution[2])
+        points[:, :lower_index] = interpolate(
+            points[:, lower_index],
+            points[:, lower_index + 1],
+            lower_residue,
+        ).reshape(shape)
+        points[:, upper_index + 1 :] = interpolate(
+            points[:, upper_index],
+            points[:, upper_index + 1],
+            upper_residue,
+        ).reshape(shape)
+    return points.reshape((nu * nv, *resolution[2:]))
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("a, b", [(0, 0.5), (0.2, 0.7), (0.5, 1)])
+def test_pointwise_become_partial_matches_partial_grids(
+    using_opengl_renderer,
+    axis,
+    a,
+    b,
+):
+    surface = OpenGLSurface(
+        lambda u, v: (u, v, u * np.sin(v)),
+        resolution=(6, 4),
+    )
+    partial = surface.copy()
+
+    partial.pointwise_become_partial(surface, a, b, axis=axis)
+
+    expected = np.vstack(
+        [
+            _partial_grid(block, a, b, (6, 4, 3), axis)
+            for block in surface.get_surface_points_and_nudged_points()
+        ],
+    )
+    np.testing.assert_allclose(partial.points, expected)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_textured_pointwise_become_partial_matches_partial_grids(
+    using_opengl_renderer,
+    axis,
+):
+    image = OpenGLImageMobject(np.zeros((4, 4, 4), dtype=np.uint8))
+    partial = image.copy()
+
+    partial.pointwise_become_partial(image, 0.2, 0.7, axis=axis)
+
+    nu, nv = image.resolution
+    np.testing.assert_allclose(
+        partial.im_coords,
+        _partial_grid(image.im_coords, 0.2, 0.7, (nu, nv, 2), axis),
+    )
+
+
+def test_surface_points_evaluated_in_chunks(using_opengl_renderer, monkeypatch):
+    chunk_sizes = []
+
+    def uv_func(u, v):
+        chunk_sizes.append(np.size(u))
+        return (np.cos(u), v, u * v)
+
+    expected = OpenGLSurface(uv_func, resolution=(5, 4)).points
+    # 3 * 5 * 4 uv values, leaving a last chunk smaller than the others
+    monkeypatch.setattr(OpenGLSurface, "uv_chunk_size", 7)
+    chunk_sizes.clear()
+    chunked = OpenGLSurface(uv_func, resolution=(5, 4))
+    assert chunk_sizes == [7] * 8 + [4]
+    scalar_only = OpenGLSurface(
+        lambda u, v: np.array([math.cos(u), v, u * v]),
+        resolution=(5, 4),
+    )
+
+    np.testing.assert_array_equal(chunked.points, expected)
+    np.testing.assert_allclose(scalar_only.points, expected)